@@ -1,29 +1,37 @@
 from __future__ import annotations
 
 import argparse
+import importlib
 import sys
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
-from .commands.hello import cmd_hello
 from .commands.help import cmd_help
 from .commands.version import cmd_version
-from .commands.extract import cmd_extract
-from .commands.categorize import cmd_categorize
 
 
 CommandFn = Callable[[List[str]], int]
 
 
-def registry() -> Dict[str, CommandFn]:
+# command -> (module, function). Command modules are imported only when that
+# command actually runs, so e.g. `hello` never loads the extractor stack.
+def registry() -> Dict[str, Tuple[str, str]]:
     return {
-        "hello": cmd_hello,
-        "help": cmd_help,
-        "version": cmd_version,
-        "extract": cmd_extract,
-        "categorize": cmd_categorize,
+        "hello": ("monarch_tools.commands.hello", "cmd_hello"),
+        "help": ("monarch_tools.commands.help", "cmd_help"),
+        "version": ("monarch_tools.commands.version", "cmd_version"),
+        "extract": ("monarch_tools.commands.extract", "cmd_extract"),
+        "categorize": ("monarch_tools.commands.categorize", "cmd_categorize"),
     }
 
 
+def _load_command(name: str) -> Optional[CommandFn]:
+    target = registry().get(name)
+    if target is None:
+        return None
+    module, attr = target
+    return getattr(importlib.import_module(module), attr)
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     argv = list(sys.argv[1:] if argv is None else argv)
 
@@ -32,8 +40,6 @@ def main(argv: Optional[List[str]] = None) -> int:
     parser.add_argument("args", nargs=argparse.REMAINDER)
     ns = parser.parse_args(argv)
 
-    cmds = registry()
-
     if not ns.command:
         return cmd_help([])
 
@@ -42,7 +48,7 @@ def main(argv: Optional[List[str]] = None) -> int:
     if ns.command in ("-V", "--version"):
         return cmd_version([])
 
-    fn = cmds.get(ns.command)
+    fn = _load_command(ns.command)
     if not fn:
         print(f"Unknown command: {ns.command}", file=sys.stderr)
         return cmd_help([])
@@ -2,22 +2,25 @@ from __future__ import annotations
 
 import json
 import re
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # optional: faster rules.json parsing
+    orjson = None
 
 
 def normalize_merchant(s: str) -> str:
-    return " ".join((s or "").strip().split())
+    return " ".join((s or "").split())
 
 
 def load_categories(path: Path) -> set[str]:
-    cats: set[str] = set()
-    for line in path.read_text(encoding="utf-8").splitlines():
-        s = line.strip()
-        if s and not s.startswith("#"):
-            cats.add(s)
-    return cats
+    # Stream the file instead of materializing the whole text and a list of lines.
+    with path.open("r", encoding="utf-8") as f:
+        return {s for s in (line.strip() for line in f) if s and not s.startswith("#")}
 
 
 @dataclass(frozen=True)
@@ -40,14 +43,60 @@ class Rules:
     patterns: List[PatternRule]
 
 
+# Specialized categorize_merchant for the hot loop: takes an already normalized
+# merchant, and the merchants lookup, the bound `search` methods and their
+# categories are bound as default arguments so they run on fast locals. It is a
+# snapshot of `rules` at call time; build it once the rules are final.
+def make_classifier(rules: Rules) -> Callable[[str], Optional[str]]:
+    def classify(
+        m: str,
+        _get: Callable[[str], Optional[str]] = rules.merchants.get,
+        _searches: List[Callable[[str], Optional[re.Match[str]]]] = [p._compiled.search for p in rules.patterns],
+        _cats: List[str] = [p.category for p in rules.patterns],
+    ) -> Optional[str]:
+        cat = _get(m)
+        if cat:
+            return cat
+        for i, search in enumerate(_searches):
+            if search(m) is not None:
+                return _cats[i]
+        return None
+
+    return classify
+
+
 def load_rules(path: Path) -> Rules:
-    data = json.loads(path.read_text(encoding="utf-8"))
+    raw = path.read_bytes()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     version = int(data.get("version", 1))
     merchants = {
         normalize_merchant(k): str(v)
         for k, v in (data.get("merchants", {}) or {}).items()
     }
-    patterns = [PatternRule.from_dict(x) for x in (data.get("patterns", []) or [])]
+
+    # Compile every pattern exactly once; a malformed regex is reported and
+    # dropped here instead of aborting the whole run. A regex repeated later in
+    # the list can never win (first match wins), so it is reported and dropped
+    # too.
+    patterns: List[PatternRule] = []
+    seen: Dict[str, str] = {}
+    for x in data.get("patterns", []) or []:
+        try:
+            pr = PatternRule.from_dict(x)
+        except re.error as e:
+            print(f"WARNING: skipping invalid pattern {x.get('regex')!r}: {e}", file=sys.stderr)
+            continue
+        first_cat = seen.get(pr.regex)
+        if first_cat is not None:
+            print(
+                f"WARNING: skipping duplicate pattern {pr.regex!r} -> {pr.category!r}; "
+                f"an earlier rule maps it to {first_cat!r}",
+                file=sys.stderr,
+            )
+            continue
+        seen[pr.regex] = pr.category
+        patterns.append(pr)
+
     return Rules(version=version, merchants=merchants, patterns=patterns)
 
 
@@ -2,15 +2,22 @@ from __future__ import annotations
 
 import argparse
 import csv
+from collections import Counter
 from pathlib import Path
 
 from monarch_tools.categorize_engine import (
-    categorize_merchant,
     load_categories,
     load_rules,
+    make_classifier,
     normalize_merchant,
 )
 
+# Larger than the 8 KiB default so big activity CSVs are read and written in
+# fewer syscalls.
+_IO_BUFFER_SIZE = 1 << 20
+# Output rows are handed to the csv writer in chunks of this many.
+_WRITE_BATCH = 4096
+
 
 def _default_out_path(in_csv: Path, suffix: str) -> Path:
     return in_csv.with_name(in_csv.name.replace(".monarch.csv", suffix))
@@ -42,45 +49,76 @@ def cmd_categorize(argv: list[str]) -> int:
     categories = load_categories(cats_path)
     rules = load_rules(rules_path)
 
-    unmatched_counts: dict[str, int] = {}
-
-    with in_csv.open("r", newline="", encoding="utf-8") as fin, out_csv.open("w", newline="", encoding="utf-8") as fout:
-        r = csv.DictReader(fin)
-        if not r.fieldnames:
+    unmatched_keys: list[str] = []
+    # Statements repeat the same merchants many times; resolve each distinct
+    # merchant string once, keeping its normalized key for the unmatched report.
+    memo: dict[str, tuple[str, str]] = {}
+    classify = make_classifier(rules)
+
+    with (
+        in_csv.open("r", newline="", encoding="utf-8", buffering=_IO_BUFFER_SIZE) as fin,
+        out_csv.open("w", newline="", encoding="utf-8", buffering=_IO_BUFFER_SIZE) as fout,
+    ):
+        r = csv.reader(fin)
+        fieldnames = next(r, None)
+        if not fieldnames:
             raise SystemExit("ERROR: input CSV has no header")
 
-        fieldnames = list(r.fieldnames)
         if "Category" not in fieldnames:
             raise SystemExit("ERROR: input CSV missing 'Category' column")
 
-        w = csv.DictWriter(fout, fieldnames=fieldnames)
-        w.writeheader()
+        # Work on plain lists: resolve the columns we need once instead of
+        # building and re-hashing a dict per row.
+        width = len(fieldnames)
+        m_idx = fieldnames.index("Merchant") if "Merchant" in fieldnames else None
+        c_idx = fieldnames.index("Category")
+
+        w = csv.writer(fout)
+        w.writerow(fieldnames)
 
+        batch: list[list[str]] = []
         for row in r:
-            merchant = row.get("Merchant", "") or ""
-            existing = (row.get("Category", "") or "").strip()
+            if len(batch) >= _WRITE_BATCH:
+                w.writerows(batch)
+                batch.clear()
 
-            if existing:
-                w.writerow(row)
+            if not row:
                 continue
+            if len(row) < width:
+                row.extend([""] * (width - len(row)))
+            elif len(row) > width:
+                raise SystemExit(f"ERROR: input CSV line {r.line_num} has more fields than the header")
 
-            cat = categorize_merchant(merchant, rules) or "Uncategorized"
-            if cat not in categories:
-                cat = "Uncategorized"
+            merchant = row[m_idx] if m_idx is not None else ""
+            existing = row[c_idx].strip()
 
-            row["Category"] = cat
-            w.writerow(row)
+            if existing:
+                batch.append(row)
+                continue
 
-            if cat == "Uncategorized":
+            hit = memo.get(merchant)
+            if hit is None:
                 key = normalize_merchant(merchant)
-                if key:
-                    unmatched_counts[key] = unmatched_counts.get(key, 0) + 1
+                cat = classify(key) or "Uncategorized"
+                if cat not in categories:
+                    cat = "Uncategorized"
+                hit = memo[merchant] = (cat, key)
+            cat, key = hit
+
+            row[c_idx] = cat
+            batch.append(row)
+
+            if cat == "Uncategorized" and key:
+                unmatched_keys.append(key)
+
+        w.writerows(batch)
+
+    unmatched_counts = Counter(unmatched_keys)
 
     with unmatched_csv.open("w", newline="", encoding="utf-8") as f:
         w = csv.writer(f)
         w.writerow(["Merchant", "Count"])
-        for merch, cnt in sorted(unmatched_counts.items(), key=lambda x: (-x[1], x[0])):
-            w.writerow([merch, cnt])
+        w.writerows(sorted(unmatched_counts.items(), key=lambda x: (-x[1], x[0])))
 
     print("wrote:")
     print(f"  categorized: {out_csv}")
@@ -6,10 +6,21 @@ from pathlib import Path
 from monarch_tools.extractors.chase.activity import extract_activity
 
 
+def _positive_int(s: str) -> int:
+    try:
+        n = int(s)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {s!r}") from None
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {n}")
+    return n
+
+
 def cmd_extract(argv: list[str]) -> int:
     parser = argparse.ArgumentParser(prog="monarch-tools extract")
     parser.add_argument("--pdf", required=True, help="Path to statement PDF")
     parser.add_argument("--out", required=True, help="Output directory")
+    parser.add_argument("--jobs", type=_positive_int, default=1, help="Worker processes for page text extraction (default: 1)")
 
     args = parser.parse_args(argv)
 
@@ -24,7 +35,7 @@ def cmd_extract(argv: list[str]) -> int:
 
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    outputs = extract_activity(pdf_path=pdf_path, out_dir=out_dir)
+    outputs = extract_activity(pdf_path=pdf_path, out_dir=out_dir, jobs=args.jobs)
 
     print("wrote:")
     for name, path in outputs.items():
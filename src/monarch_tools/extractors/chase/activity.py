@@ -2,17 +2,21 @@ from __future__ import annotations
 
 import csv
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Iterable, List, Tuple
-
-import pdfplumber
+from types import ModuleType
+from typing import Iterable, Iterator, List, Tuple
 
 
+# Whitespace runs use possessive quantifiers (*+, ++) so a long run of spaces in
+# a raw line can't be split every possible way between desc, the separators and
+# the amount's optional parts, which backtracks catastrophically.
 DATE_LINE_RE = re.compile(
-    r"^\s*(?P<m>\d{1,2})[/-](?P<d>\d{1,2})(?:[/-](?P<y>\d{2,4}))?\s+"
-    r"(?P<desc>.+?)\s+"
-    r"(?P<amount>[+\-\u2212]?\s*\$?\s*\(?\s*(?:\d[\d,]*\.\d+|\d[\d,]+|\.\d+)\s*\)?\s*(?:CR)?)\s*$"
+    r"^\s*+(?P<m>\d{1,2})[/-](?P<d>\d{1,2})(?:[/-](?P<y>\d{2,4}))?\s++"
+    r"(?P<desc>.+?)\s++"
+    r"(?P<amount>[+\-\u2212]?\s*+\$?\s*+\(?\s*+(?:\d[\d,]*\.\d+|\d[\d,]+|\.\d+)\s*+\)?\s*+(?:CR)?)\s*+$"
 )
 
 CLOSING_DATE_RE = re.compile(
@@ -20,8 +24,12 @@ CLOSING_DATE_RE = re.compile(
     re.IGNORECASE,
 )
 
+MULTI_SPACE_RE = re.compile(r"\s{2,}")
+NON_AMOUNT_CHARS_RE = re.compile(r"[^0-9.]")
+
 
-@dataclass
+# One per statement line; slots keep the per-instance footprint down.
+@dataclass(slots=True)
 class Txn:
     yyyy_mm_dd: str
     description: str
@@ -33,7 +41,7 @@ def _stem(p: Path) -> str:
 
 
 def _normalize_spaces(s: str) -> str:
-    return re.sub(r"\s{2,}", " ", s.strip())
+    return MULTI_SPACE_RE.sub(" ", s.strip())
 
 
 def _strip_leading_amp(desc: str) -> str:
@@ -41,8 +49,7 @@ def _strip_leading_amp(desc: str) -> str:
 
 
 def _amount_to_value(amount_display: str) -> float:
-    s_raw = amount_display.strip()
-    s = s_raw.upper()
+    s = amount_display.upper()
 
     has_cr = s.endswith("CR")
     if has_cr:
@@ -66,14 +73,19 @@ def _amount_to_value(amount_display: str) -> float:
     if s.startswith("."):
         s = "0" + s
 
-    s2 = re.sub(r"[^0-9.]", "", s)
-    if s2 == "" or s2 == ".":
-        val = 0.0
+    # Common case: only ASCII digits and at most one dot are left, so the
+    # character filter below would be a no-op.
+    if s.isascii() and s.replace(".", "", 1).isdigit():
+        val = float(s)
     else:
-        parts = s2.split(".")
-        if len(parts) > 2:
-            s2 = parts[0] + "." + "".join(parts[1:])
-        val = float(s2)
+        s2 = NON_AMOUNT_CHARS_RE.sub("", s)
+        if s2 == "" or s2 == ".":
+            val = 0.0
+        else:
+            parts = s2.split(".")
+            if len(parts) > 2:
+                s2 = parts[0] + "." + "".join(parts[1:])
+            val = float(s2)
 
     if has_cr:
         return +val
@@ -84,9 +96,8 @@ def _value_sign(val: float) -> int:
     return 1 if val > 1e-12 else (-1 if val < -1e-12 else 0)
 
 
-def _find_closing_year(pdf: "pdfplumber.PDF") -> Tuple[int, int, int]:
-    for page in pdf.pages:
-        text = page.extract_text() or ""
+def _find_closing_year(page_texts: List[str]) -> Tuple[int, int, int]:
+    for text in page_texts:
         m = CLOSING_DATE_RE.search(text)
         if m:
             y = int(m.group("y"))
@@ -107,17 +118,17 @@ def _infer_full_date(m: int, d: int, closing_year: int, closing_month: int, y_fr
     return f"{year:04d}-{m:02d}-{d:02d}"
 
 
-def _extract_activity_lines(pdf: "pdfplumber.PDF") -> List[str]:
+def _extract_activity_lines(page_texts: List[str]) -> List[str]:
     lines: List[str] = []
-    for page in pdf.pages:
-        text = page.extract_text() or ""
+    for text in page_texts:
         if not text:
             continue
         page_lines = [ln.rstrip() for ln in text.splitlines()]
         in_section = False
         for ln in page_lines:
             ln_clean = ln.strip()
-            if "ACCOUNT" in ln_clean.upper() and "ACTIVITY" in ln_clean.upper():
+            ln_upper = ln_clean.upper()
+            if "ACCOUNT" in ln_upper and "ACTIVITY" in ln_upper:
                 in_section = True
                 continue
             if in_section and ln_clean.isupper() and len(ln_clean) > 6 and "ACCOUNT" not in ln_clean:
@@ -127,19 +138,43 @@ def _extract_activity_lines(pdf: "pdfplumber.PDF") -> List[str]:
     return lines
 
 
-def _extract_candidate_lines_anywhere(pdf: "pdfplumber.PDF") -> List[str]:
+def _extract_candidate_lines_anywhere(page_texts: List[str]) -> List[str]:
     keep: List[str] = []
-    for page in pdf.pages:
-        text = page.extract_text() or ""
+    for text in page_texts:
         for ln in text.splitlines() if text else []:
             s = ln.rstrip()
-            if DATE_LINE_RE.match(s.strip()):
+            if DATE_LINE_RE.match(s):
                 keep.append(s)
     return keep
 
 
-def _parse_transactions(lines: Iterable[str], closing_year: int, closing_month: int) -> List[Txn]:
-    txns: List[Txn] = []
+# Imported on first use so CLI commands that never touch PDFs don't pay for it.
+def _get_pdfplumber() -> ModuleType:
+    import pdfplumber
+
+    return pdfplumber
+
+
+def _extract_page_text(pdf_path: Path, page_num: int) -> str:
+    with _get_pdfplumber().open(pdf_path, pages=[page_num + 1]) as pdf:
+        return pdf.pages[0].extract_text() or ""
+
+
+def _read_page_texts(pdf_path: Path, jobs: int) -> List[str]:
+    # Text extraction is the expensive part; do it once per page and let every
+    # pass work from the same strings.
+    with _get_pdfplumber().open(pdf_path) as pdf:
+        if jobs <= 1 or len(pdf.pages) <= 1:
+            return [page.extract_text() or "" for page in pdf.pages]
+        n_pages = len(pdf.pages)
+
+    # pdfminer's layout analysis is pure Python, so pages are spread across
+    # processes; each worker reopens the file and handles one page.
+    with ProcessPoolExecutor(max_workers=min(jobs, n_pages)) as ex:
+        return list(ex.map(partial(_extract_page_text, pdf_path), range(n_pages)))
+
+
+def _parse_transactions(lines: Iterable[str], closing_year: int, closing_month: int) -> Iterator[Txn]:
     for raw in lines:
         s = _normalize_spaces(raw)
         m = DATE_LINE_RE.match(s)
@@ -156,15 +191,15 @@ def _parse_transactions(lines: Iterable[str], closing_year: int, closing_month:
             if y_from_line < 100:
                 y_from_line += 2000
 
-        desc = _strip_leading_amp(m.group("desc").strip())
-        amt_disp = m.group("amount").strip()
+        # `s` is stripped with single whitespace runs, so neither group can
+        # start or end with whitespace.
+        desc = _strip_leading_amp(m.group("desc"))
+        amt_disp = m.group("amount")
         full_date = _infer_full_date(mm, dd, closing_year, closing_month, y_from_line=y_from_line)
-        txns.append(Txn(full_date, desc, amt_disp))
+        yield Txn(full_date, desc, amt_disp)
 
-    return txns
 
-
-def extract_activity(*, pdf_path: Path, out_dir: Path) -> dict[str, Path]:
+def extract_activity(*, pdf_path: Path, out_dir: Path, jobs: int = 1) -> dict[str, Path]:
     if not pdf_path.exists():
         raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
@@ -175,17 +210,25 @@ def extract_activity(*, pdf_path: Path, out_dir: Path) -> dict[str, Path]:
     activity_csv = out_dir / f"{stem}.activity.csv"
     monarch_csv = out_dir / f"{stem}.monarch.csv"
 
-    with pdfplumber.open(pdf_path) as pdf:
-        closing_year, closing_month, _ = _find_closing_year(pdf)
-        lines = _extract_activity_lines(pdf)
-        if not lines:
-            lines = _extract_candidate_lines_anywhere(pdf)
-        txns = _parse_transactions(lines, closing_year, closing_month)
-
+    page_texts = _read_page_texts(pdf_path, jobs)
+    closing_year, closing_month, _ = _find_closing_year(page_texts)
+    lines = _extract_activity_lines(page_texts)
+    if not lines:
+        lines = _extract_candidate_lines_anywhere(page_texts)
+    txns = _parse_transactions(lines, closing_year, closing_month)
+
+    # One pass over the parsed transactions builds both outputs' rows and the
+    # summary totals; nothing is written until parsing has succeeded.
+    activity_rows: List[Tuple[str, ...]] = []
+    monarch_rows: List[Tuple[str, ...]] = []
     pos_count = neg_count = 0
     pos_sum = neg_sum = 0.0
     for t in txns:
         val = _amount_to_value(t.amount_display)
+        val_disp = f"{val:.2f}"
+        activity_rows.append((t.yyyy_mm_dd, t.description, t.amount_display, val_disp))
+        monarch_rows.append((t.yyyy_mm_dd, t.description, val_disp, "", "", ""))
+
         sgn = _value_sign(val)
         if sgn > 0:
             pos_count += 1
@@ -202,15 +245,14 @@ def extract_activity(*, pdf_path: Path, out_dir: Path) -> dict[str, Path]:
     with activity_csv.open("w", newline="", encoding="utf-8") as f:
         w = csv.writer(f)
         w.writerow(["Date", "Description", "Amount", "AmountValue"])
-        for t in txns:
-            w.writerow([t.yyyy_mm_dd, t.description, t.amount_display, f"{_amount_to_value(t.amount_display):.2f}"])
+        w.writerows(activity_rows)
 
     with summary_csv.open("w", newline="", encoding="utf-8") as f:
         w = csv.writer(f)
         w.writerow(["Key", "Value"])
         w.writerow(["SourcePDF", str(pdf_path)])
         w.writerow(["Extractor", "chase"])
-        w.writerow(["TransactionCount", str(len(txns))])
+        w.writerow(["TransactionCount", str(len(activity_rows))])
         w.writerow(["PaymentsAndCreditsCount", str(payments_count)])
         w.writerow(["PurchasesAndFeesCount", str(purchases_count)])
         w.writerow(["TotalPaymentsAndCredits", f"{payments_total:.2f}"])
@@ -219,7 +261,6 @@ def extract_activity(*, pdf_path: Path, out_dir: Path) -> dict[str, Path]:
     with monarch_csv.open("w", newline="", encoding="utf-8") as f:
         w = csv.writer(f)
         w.writerow(["Date", "Merchant", "Amount", "Category", "Account", "Notes"])
-        for t in txns:
-            w.writerow([t.yyyy_mm_dd, t.description, f"{_amount_to_value(t.amount_display):.2f}", "", "", ""])
+        w.writerows(monarch_rows)
 
     return {"summary": summary_csv, "activity": activity_csv, "monarch": monarch_csv}